@@ -13,6 +13,7 @@
 # limitations under the License.
 import math
 from collections import defaultdict, OrderedDict
+from functools import lru_cache
 from typing import Any, DefaultDict, Dict, Generator, List, Optional, overload, Tuple, Union
 
 import numpy as np
@@ -24,7 +25,7 @@ from pytorch_lightning import loops  # import as loops to avoid circular imports
 from pytorch_lightning.loops.optimization import ManualOptimization, OptimizerLoop
 from pytorch_lightning.loops.optimization.manual_loop import _OUTPUTS_TYPE as _MANUAL_LOOP_OUTPUTS_TYPE
 from pytorch_lightning.loops.optimization.optimizer_loop import _OUTPUTS_TYPE as _OPTIMIZER_LOOP_OUTPUTS_TYPE
-from pytorch_lightning.loops.utilities import _get_active_optimizers, _is_max_limit_reached
+from pytorch_lightning.loops.utilities import _get_active_optimizers
 from pytorch_lightning.trainer.connectors.logger_connector.result import _ResultCollection
 from pytorch_lightning.trainer.progress import BatchProgress, SchedulerProgress
 from pytorch_lightning.trainer.supporters import CombinedLoader
@@ -84,6 +85,7 @@ class TrainingEpochLoop(loops.Loop):
         # caches the loaded dataloader state until dataloader objects are available
         self._dataloader_state_dict: Dict[str, Any] = {}
         self._batches_that_stepped: int = 0
+        self._should_prepare_batch_end_outputs: bool = True
 
     @property
     def total_batch_idx(self) -> int:
@@ -108,7 +110,9 @@ class TrainingEpochLoop(loops.Loop):
 
     @property
     def _is_training_done(self) -> bool:
-        max_steps_reached = _is_max_limit_reached(self.global_step, self.max_steps)
+        # mirrors `_is_max_limit_reached` on purpose: `global_step` goes through the LightningModule, so it's only
+        # evaluated when there's a step limit
+        max_steps_reached = self.max_steps != -1 and self.global_step >= self.max_steps
         return max_steps_reached or self._num_ready_batches_reached()
 
     @property
@@ -184,6 +188,9 @@ class TrainingEpochLoop(loops.Loop):
         data_fetcher._start_profiler = self._on_before_fetch
         data_fetcher._stop_profiler = self._on_after_fetch
 
+        # evaluated per run because `trainer.callbacks` can be swapped within a fit, e.g. by the tuner
+        self._should_prepare_batch_end_outputs = self._has_on_train_batch_end_listeners()
+
     def _on_before_fetch(self) -> None:
         self.trainer.profiler.start(f"[{self.__class__.__name__}].train_dataloader_next")
 
@@ -201,6 +208,8 @@ class TrainingEpochLoop(loops.Loop):
             return
         # we are going to train first so the val loop does not need to restart
         self.val_loop.restarting = False
+        trainer = self.trainer
+        lightning_module = trainer.lightning_module
 
         if not isinstance(data_fetcher, DataLoaderIterDataFetcher):
             batch_idx = self.batch_idx + 1
@@ -213,27 +222,27 @@ class TrainingEpochLoop(loops.Loop):
 
         self.batch_progress.increment_ready()
 
-        self.trainer._logger_connector.on_batch_start(batch, batch_idx)
+        trainer._logger_connector.on_batch_start(batch, batch_idx)
 
         batch_output: _BATCH_OUTPUTS_TYPE = None  # for mypy
         if batch is None:
             self._warning_cache.warn("train_dataloader yielded None. If this was on purpose, ignore this warning...")
         else:
             # hook
-            self.trainer._call_callback_hooks("on_train_batch_start", batch, batch_idx)
-            response = self.trainer._call_lightning_module_hook("on_train_batch_start", batch, batch_idx)
-            self.trainer._call_strategy_hook("on_train_batch_start", batch, batch_idx)
+            trainer._call_callback_hooks("on_train_batch_start", batch, batch_idx)
+            response = trainer._call_lightning_module_hook("on_train_batch_start", batch, batch_idx)
+            trainer._call_strategy_hook("on_train_batch_start", batch, batch_idx)
             if response == -1:
                 self.batch_progress.increment_processed()
                 raise StopIteration
 
             self.batch_progress.increment_started()
 
-            with self.trainer.profiler.profile("run_training_batch"):
+            with trainer.profiler.profile("run_training_batch"):
                 # choose which loop will run the optimization
-                if self.trainer.lightning_module.automatic_optimization:
+                if lightning_module.automatic_optimization:
                     optimizers = _get_active_optimizers(
-                        self.trainer.optimizers, self.trainer.optimizer_frequencies, kwargs.get("batch_idx", 0)
+                        trainer.optimizers, trainer.optimizer_frequencies, kwargs.get("batch_idx", 0)
                     )
                     batch_output = self.optimizer_loop.run(optimizers, kwargs)
                 else:
@@ -247,19 +256,23 @@ class TrainingEpochLoop(loops.Loop):
         if self._num_ready_batches_reached():
             self.update_lr_schedulers("epoch", update_plateau_schedulers=False)
 
-        batch_end_outputs = self._prepare_outputs_training_batch_end(
-            batch_output,
-            lightning_module=self.trainer.lightning_module,
-            num_optimizers=len(self.trainer.optimizers),
-        )
+        # skip converting the outputs if nobody implements `on_train_batch_end`. the hooks get an empty list, same as
+        # when all optimizers skipped the batch
+        batch_end_outputs: Union[Dict[str, Any], List[Dict[str, Any]]] = []
+        if self._should_prepare_batch_end_outputs:
+            batch_end_outputs = self._prepare_outputs_training_batch_end(
+                batch_output,
+                lightning_module=lightning_module,
+                num_optimizers=len(trainer.optimizers),
+            )
 
-        self.trainer._call_callback_hooks("on_train_batch_end", batch_end_outputs, batch, batch_idx)
-        self.trainer._call_lightning_module_hook("on_train_batch_end", batch_end_outputs, batch, batch_idx)
-        self.trainer._logger_connector.on_batch_end()
+        trainer._call_callback_hooks("on_train_batch_end", batch_end_outputs, batch, batch_idx)
+        trainer._call_lightning_module_hook("on_train_batch_end", batch_end_outputs, batch, batch_idx)
+        trainer._logger_connector.on_batch_end()
 
         self.batch_progress.increment_completed()
 
-        if batch_output and is_overridden("training_epoch_end", self.trainer.lightning_module):
+        if batch_output and self._should_track_batch_outputs_for_epoch_end():
             # batch_output may be empty
             # automatic: can be empty if all optimizers skip their batches
             # manual: #9052 added support for raising `StopIteration` in the `training_step`. If that happens,
@@ -269,22 +282,25 @@ class TrainingEpochLoop(loops.Loop):
         # -----------------------------------------
         # SAVE METRICS TO LOGGERS AND PROGRESS_BAR
         # -----------------------------------------
-        self.trainer._logger_connector.update_train_step_metrics()
+        trainer._logger_connector.update_train_step_metrics()
 
     def on_advance_end(self) -> None:
         # -----------------------------------------
         # VALIDATE IF NEEDED
         # -----------------------------------------
+        trainer = self.trainer
         should_check_val = self._should_check_val_fx()
         if should_check_val:
-            self.trainer.validating = True
+            trainer.validating = True
             self._run_validation()
-            self.trainer.training = True
+            trainer.training = True
+
+        should_accumulate = self._should_accumulate()
 
         # update plateau LR scheduler after metrics are logged
-        self.update_lr_schedulers("step", update_plateau_schedulers=True)
+        self.update_lr_schedulers("step", update_plateau_schedulers=True, should_accumulate=should_accumulate)
 
-        if not self._should_accumulate():
+        if not should_accumulate:
             # this is increased once per batch disregarding multiple optimizers on purpose for loggers
             self._batches_that_stepped += 1
         # this will save based on the `batches_that_stepped` value
@@ -294,7 +310,7 @@ class TrainingEpochLoop(loops.Loop):
         # which might not be the case depending on what's in the `*_epoch_end` hooks
         if not self._is_training_done:
             # if fault tolerant is enabled and process has been notified, exit.
-            self.trainer._exit_gracefully_on_signal()
+            trainer._exit_gracefully_on_signal()
 
     def on_run_end(self) -> _OUTPUTS_TYPE:
         outputs, self._outputs = self._outputs, []
@@ -303,6 +319,9 @@ class TrainingEpochLoop(loops.Loop):
     def teardown(self) -> None:
         self._results.cpu()
         self.val_loop.teardown()
+        # in case the model changes
+        self._should_track_batch_outputs_for_epoch_end.cache_clear()
+        self._training_step_takes_batch_idx.cache_clear()
 
     def on_save_checkpoint(self) -> Dict:
         state_dict = super().on_save_checkpoint()
@@ -343,8 +362,9 @@ class TrainingEpochLoop(loops.Loop):
 
     def _num_ready_batches_reached(self) -> bool:
         """Checks if we are in the last batch or if there are more batches to follow."""
-        epoch_finished_on_ready = self.batch_progress.current.ready == self.trainer.num_training_batches
-        return epoch_finished_on_ready or self.batch_progress.is_last_batch
+        batch_progress = self.batch_progress
+        # check the flag first, it avoids the trainer lookup on the last batch
+        return batch_progress.is_last_batch or batch_progress.current.ready == self.trainer.num_training_batches
 
     def _num_completed_batches_reached(self) -> bool:
         epoch_finished_on_completed = self.batch_progress.current.completed == self.trainer.num_training_batches
@@ -369,23 +389,20 @@ class TrainingEpochLoop(loops.Loop):
         batch_output: _BATCH_OUTPUTS_TYPE,
         lightning_module: "pl.LightningModule",
         num_optimizers: int,
-    ) -> Union[List[List[Dict[str, Any]]], List[Dict[str, Any]]]:
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """Processes the outputs from the batch loop into the format passed to the ``on_train_batch_end`` hook."""
         if not batch_output:
-            return []  # type: ignore[return-value]
+            return []
 
-        # convert optimizer dicts to list
-        if lightning_module.automatic_optimization:
-            batch_output = apply_to_collection(
-                batch_output, dtype=dict, function=_convert_optim_dict, num_optimizers=num_optimizers
-            )
+        if not lightning_module.automatic_optimization:
+            return batch_output  # type: ignore[return-value]
 
-        array = np.array(batch_output, dtype=object)
-        # squeeze all single-element dimensions
-        array = array.squeeze()
-        array = array.tolist()
-        array = _recursive_unpad(array)
-        return array
+        # convert the optimizer dict to a list
+        outputs = _convert_optim_dict(batch_output, num_optimizers)  # type: ignore[arg-type]
+        if len(outputs) == 1:
+            return outputs[0]  # type: ignore[return-value]
+        # remove the optimizers that were skipped for this batch
+        return [output for output in outputs if output is not None]
 
     @staticmethod
     def _prepare_outputs_training_epoch_end(
@@ -412,13 +429,28 @@ class TrainingEpochLoop(loops.Loop):
         # in case we squeezed from 1-element array to a 0-dim array
         array = array if isinstance(array, list) else [array]
         # remove residual empty lists
-        array = [item for item in array if not isinstance(item, list) or len(item)]
+        array = [item for item in array if not isinstance(item, list) or item]
         return array
 
-    def update_lr_schedulers(self, interval: str, update_plateau_schedulers: bool) -> None:
-        """updates the lr schedulers based on the given interval."""
-        if interval == "step" and self._should_accumulate():
+    def update_lr_schedulers(
+        self, interval: str, update_plateau_schedulers: bool, should_accumulate: Optional[bool] = None
+    ) -> None:
+        """updates the lr schedulers based on the given interval.
+
+        Args:
+            interval: either 'epoch' or 'step'.
+            update_plateau_schedulers: control whether ``ReduceLROnPlateau`` or non-plateau schedulers get updated.
+            should_accumulate: the result of :meth:`_should_accumulate` for the current batch, if already known.
+                Only used for the 'step' interval.
+        """
+        if not self.trainer.lr_scheduler_configs or not self.trainer.lightning_module.automatic_optimization:
+            # nothing to update. skip the accumulation check and resolving the active optimizers
             return
+        if interval == "step":
+            if should_accumulate is None:
+                should_accumulate = self._should_accumulate()
+            if should_accumulate:
+                return
         active_optimizers = _get_active_optimizers(
             self.trainer.optimizers, self.trainer.optimizer_frequencies, self.total_batch_idx
         )
@@ -431,7 +463,8 @@ class TrainingEpochLoop(loops.Loop):
     def _update_learning_rates(
         self, interval: str, update_plateau_schedulers: bool, opt_indices: Optional[List[int]] = None
     ) -> None:
-        """Update learning rates.
+        """Update learning rates. Callers must check that schedulers are configured and that automatic
+        optimization is enabled, see :meth:`update_lr_schedulers`.
 
         Args:
             interval: either 'epoch' or 'step'.
@@ -441,21 +474,20 @@ class TrainingEpochLoop(loops.Loop):
                 so they have to be updated separately.
             opt_indices: indices of the optimizers to update.
         """
-        if not self.trainer.lr_scheduler_configs or not self.trainer.lightning_module.automatic_optimization:
-            return
-
         if opt_indices is None:
             opt_indices = []
 
-        for config in self.trainer.lr_scheduler_configs:
+        trainer = self.trainer
+        current_idx = self.batch_idx if interval == "step" else trainer.current_epoch
+        current_idx += 1  # account for both batch and epoch starts from 0
+
+        for config in trainer.lr_scheduler_configs:
             if config.opt_idx not in opt_indices:
                 continue
 
             if update_plateau_schedulers ^ config.reduce_on_plateau:
                 continue
 
-            current_idx = self.batch_idx if interval == "step" else self.trainer.current_epoch
-            current_idx += 1  # account for both batch and epoch starts from 0
             # Take step if call to update_learning_rates matches the interval key and
             # the current step modulo the schedulers frequency is zero
             if config.interval == interval and current_idx % config.frequency == 0:
@@ -466,7 +498,7 @@ class TrainingEpochLoop(loops.Loop):
                     monitor_val = self._get_monitor_value(monitor_key)
                     if monitor_val is None:
                         if config.strict:
-                            avail_metrics = list(self.trainer.callback_metrics)
+                            avail_metrics = list(trainer.callback_metrics)
                             raise MisconfigurationException(
                                 f"ReduceLROnPlateau conditioned on metric {monitor_key}"
                                 f" which is not available. Available metrics are: {avail_metrics}."
@@ -483,7 +515,7 @@ class TrainingEpochLoop(loops.Loop):
                 self.scheduler_progress.increment_ready()
 
                 # update LR
-                self.trainer._call_lightning_module_hook(
+                trainer._call_lightning_module_hook(
                     "lr_scheduler_step",
                     config.scheduler,
                     config.opt_idx,
@@ -496,36 +528,35 @@ class TrainingEpochLoop(loops.Loop):
         return self.trainer.callback_metrics.get(key)
 
     def _should_check_val_epoch(self) -> bool:
-        return self.trainer.enable_validation and (
-            self.trainer.check_val_every_n_epoch is None
-            or (self.trainer.current_epoch + 1) % self.trainer.check_val_every_n_epoch == 0
+        trainer = self.trainer
+        return trainer.enable_validation and (
+            trainer.check_val_every_n_epoch is None
+            or (trainer.current_epoch + 1) % trainer.check_val_every_n_epoch == 0
         )
 
     def _should_check_val_fx(self) -> bool:
         """Decide if we should run validation."""
-        if not self._should_check_val_epoch():
-            return False
-
+        trainer = self.trainer
+        val_check_batch = trainer.val_check_batch
         # val_check_batch is inf for iterable datasets with no length defined
-        is_infinite_dataset = self.trainer.val_check_batch == float("inf")
+        is_infinite_dataset = val_check_batch == float("inf")
         is_last_batch = self.batch_progress.is_last_batch
-        if is_last_batch and is_infinite_dataset:
-            return True
-
-        if self.trainer.should_stop:
-            return True
 
         # TODO: let training/eval loop handle logic around limit_*_batches and val_check_batch
-        is_val_check_batch = is_last_batch
-        if isinstance(self.trainer.limit_train_batches, int) and is_infinite_dataset:
-            is_val_check_batch = (self.batch_idx + 1) % self.trainer.limit_train_batches == 0
-        elif self.trainer.val_check_batch != float("inf"):
+        if (is_last_batch and is_infinite_dataset) or trainer.should_stop:
+            is_val_check_batch = True
+        elif not is_infinite_dataset:
             # if `check_val_every_n_epoch is `None`, run a validation loop every n training batches
             # else condition it based on the batch_idx of the current epoch
-            current_iteration = self.total_batch_idx if self.trainer.check_val_every_n_epoch is None else self.batch_idx
-            is_val_check_batch = (current_iteration + 1) % self.trainer.val_check_batch == 0
+            current_iteration = self.total_batch_idx if trainer.check_val_every_n_epoch is None else self.batch_idx
+            is_val_check_batch = (current_iteration + 1) % val_check_batch == 0
+        elif isinstance(trainer.limit_train_batches, int):
+            is_val_check_batch = (self.batch_idx + 1) % trainer.limit_train_batches == 0
+        else:
+            is_val_check_batch = is_last_batch
 
-        return is_val_check_batch
+        # the epoch-level check inspects the model, so only evaluate it on the batches that would validate
+        return is_val_check_batch and self._should_check_val_epoch()
 
     def _save_loggers_on_train_batch_end(self) -> None:
         """Flushes loggers to disk."""
@@ -550,12 +581,29 @@ class TrainingEpochLoop(loops.Loop):
             The kwargs passed down to the hooks.
         """
         kwargs["batch"] = batch
+        if self._training_step_takes_batch_idx():
+            kwargs["batch_idx"] = batch_idx
+        return kwargs
+
+    @lru_cache(1)
+    def _training_step_takes_batch_idx(self) -> bool:
+        """Whether ``training_step`` should receive the ``batch_idx`` argument."""
         training_step_fx = getattr(self.trainer.lightning_module, "training_step")
         # the `batch_idx` is optional, however, when there's more than 1 argument we cannot differentiate whether the
         # user wants the `batch_idx` or another key like `optimizer_idx` as we are not strict about the argument names
-        if is_param_in_hook_signature(training_step_fx, "batch_idx", min_args=2):
-            kwargs["batch_idx"] = batch_idx
-        return kwargs
+        return is_param_in_hook_signature(training_step_fx, "batch_idx", min_args=2)
+
+    @lru_cache(1)
+    def _should_track_batch_outputs_for_epoch_end(self) -> bool:
+        """Whether the batch outputs should be stored for later usage."""
+        return is_overridden("training_epoch_end", self.trainer.lightning_module)
+
+    def _has_on_train_batch_end_listeners(self) -> bool:
+        """Whether any callback or the LightningModule implements ``on_train_batch_end`` and needs the outputs."""
+        trainer = self.trainer
+        return is_overridden("on_train_batch_end", trainer.lightning_module) or any(
+            is_overridden("on_train_batch_end", callback) for callback in trainer.callbacks
+        )
 
 
 def _convert_optim_dict(outs: Dict[int, Dict[str, Any]], num_optimizers: int) -> List[Optional[Dict[str, Any]]]:
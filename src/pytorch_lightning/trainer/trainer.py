@@ -1269,7 +1269,7 @@ class Trainer:
             fn = getattr(callback, hook_name)
             if callable(fn):
                 with self.profiler.profile(f"[Callback]{callback.state_key}.{hook_name}"):
-                    fn(self, self.lightning_module, *args, **kwargs)
+                    fn(self, pl_module, *args, **kwargs)
 
         if pl_module:
             # restore current_fx when nested context
@@ -16,7 +16,7 @@ from unittest.mock import patch
 
 import pytest
 
-from pytorch_lightning import LightningModule
+from pytorch_lightning import Callback, LightningModule
 from pytorch_lightning.demos.boring_classes import BoringModel
 from pytorch_lightning.loops import TrainingEpochLoop
 from pytorch_lightning.trainer.trainer import Trainer
@@ -104,12 +104,13 @@ class TestPrepareOutputs:
     @pytest.mark.parametrize(
         "num_optimizers,batch_end_outputs,expected",
         [
-            (1, [], []),
-            (1, [[]], []),
+            (1, {}, []),
             # 1 optimizer
-            (1, [{0: _out00}], _out00),
+            (1, {0: _out00}, _out00),
             # 2 optimizers
-            (2, [{0: _out00, 1: _out01}], [_out00, _out01]),
+            (2, {0: _out00, 1: _out01}, [_out00, _out01]),
+            # 2 optimizers, different frequency
+            (2, {1: _out11}, [_out11]),
         ],
     )
     def test_prepare_outputs_training_batch_end_automatic(self, num_optimizers, batch_end_outputs, expected):
@@ -121,10 +122,8 @@ class TestPrepareOutputs:
     @pytest.mark.parametrize(
         "batch_end_outputs,expected",
         [
-            ([], []),
-            ([[]], []),
-            # skipped outputs
-            ([_out00, None, _out02], [_out00, _out02]),
+            ({}, []),
+            (_out00, _out00),
         ],
     )
     def test_prepare_outputs_training_batch_end_manual(self, batch_end_outputs, expected):
@@ -158,6 +157,38 @@ def test_no_val_on_train_epoch_loop_restart(tmpdir):
         assert advance_mocked.call_count == 1
 
 
+@pytest.mark.parametrize("listener", [None, "callback", "module"])
+def test_prepare_outputs_training_batch_end_skipped_without_listeners(tmpdir, listener):
+    """Test that the batch outputs are only converted when something implements the `on_train_batch_end` hook."""
+
+    class BatchEndCallback(Callback):
+        def on_train_batch_end(self, trainer, pl_module, outputs, batch, batch_idx):
+            assert outputs["loss"] is not None
+
+    class BatchEndModel(BoringModel):
+        def on_train_batch_end(self, outputs, batch, batch_idx):
+            assert outputs["loss"] is not None
+
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_steps=2,
+        limit_val_batches=0,
+        enable_progress_bar=False,
+        enable_checkpointing=False,
+        enable_model_summary=False,
+        logger=False,
+        callbacks=[BatchEndCallback()] if listener == "callback" else [],
+    )
+    model = BatchEndModel() if listener == "module" else BoringModel()
+    with patch.object(
+        TrainingEpochLoop,
+        "_prepare_outputs_training_batch_end",
+        wraps=TrainingEpochLoop._prepare_outputs_training_batch_end,
+    ) as prepare_mock:
+        trainer.fit(model)
+    assert prepare_mock.call_count == (0 if listener is None else 2)
+
+
 @pytest.mark.parametrize(
     "min_epochs, min_steps, current_epoch, global_step, early_stop, epoch_loop_done, raise_info_msg",
     [
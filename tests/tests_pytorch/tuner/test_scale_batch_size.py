@@ -20,7 +20,7 @@ import torch
 from lightning_utilities.test.warning import no_warning_call
 from torch.utils.data import DataLoader
 
-from pytorch_lightning import Trainer
+from pytorch_lightning import Callback, Trainer
 from pytorch_lightning.callbacks.batch_size_finder import BatchSizeFinder
 from pytorch_lightning.demos.boring_classes import BoringDataModule, BoringModel, RandomDataset
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
@@ -472,3 +472,27 @@ def test_dataloader_batch_size_updated_on_failure(_, tmpdir, scale_method, expec
     assert new_batch_size == model.batch_size
     assert new_batch_size == expected_batch_size
     assert trainer.train_dataloader.loaders.batch_size == expected_batch_size
+
+
+def test_batch_size_finder_callback_batch_end_outputs(tmpdir):
+    """Test that callbacks still receive the batch outputs after the batch size finder ran its trials without
+    them."""
+
+    class BatchEndCallback(Callback):
+        def __init__(self):
+            self.num_calls = 0
+
+        def on_train_batch_end(self, trainer, pl_module, outputs, batch, batch_idx):
+            assert outputs["loss"] is not None
+            self.num_calls += 1
+
+    batch_end_callback = BatchEndCallback()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=2,
+        limit_val_batches=0,
+        callbacks=[BatchSizeFinder(max_trials=2, batch_arg_name="batch_size"), batch_end_callback],
+    )
+    trainer.fit(BatchSizeModel(batch_size=2))
+    assert batch_end_callback.num_calls == 2